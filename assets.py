@@ -0,0 +1,109 @@
+"""Fingerprinted static assets
+
+build_assets.py writes minified, precompressed files with a content hash in
+their name to static/dist, plus a manifest mapping each original name to its
+built files. Templates link them with asset_url() / asset_srcset(), and they
+are served with far-future immutable cache headers.
+
+Without a build, and always in debug mode, the helpers fall back to plain
+static files, versioned by modification time so a deploy or an edit still
+changes their URL.
+"""
+
+import json
+import mimetypes
+import os
+
+from flask import Blueprint, current_app, request, send_from_directory, url_for
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+DIST_DIR = os.path.join(STATIC_DIR, "dist")
+MANIFEST_FILE = os.path.join(DIST_DIR, "manifest.json")
+
+# Hashed names never change content, so browsers can keep them for a year
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+
+# Precompressed variants, in order of preference
+ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+assets_bp = Blueprint("assets", __name__)
+
+
+def load_manifest():
+    """Return manifest written by build_assets.py, empty if not built"""
+
+    try:
+        with open(MANIFEST_FILE) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def static_url(filename):
+    """Return URL of plain static file, with its modification time as version"""
+
+    try:
+        version = int(os.path.getmtime(os.path.join(STATIC_DIR, filename)))
+    except OSError:
+        return url_for("static", filename=filename)
+
+    return url_for("static", filename=filename, v=version)
+
+
+def asset_url(filename):
+    """Return URL of the built version of static file filename"""
+
+    entry = current_app.config["ASSET_MANIFEST"].get(filename)
+    if not entry:
+        return static_url(filename)
+
+    return url_for("assets.serve_asset", filename=entry["file"])
+
+
+def asset_srcset(filename):
+    """Return srcset of the resized versions of image filename, if built"""
+
+    entry = current_app.config["ASSET_MANIFEST"].get(filename)
+    if not entry or not entry.get("srcset"):
+        return ""
+
+    return ", ".join(
+        f"{url_for('assets.serve_asset', filename=file)} {width}w"
+        for file, width in entry["srcset"]
+    )
+
+
+@assets_bp.route("/assets/<path:filename>")
+def serve_asset(filename):
+    """Serve built asset, precompressed if the browser accepts it"""
+
+    mimetype = mimetypes.guess_type(filename)[0]
+
+    for encoding, extension in ENCODINGS:
+        if encoding in request.accept_encodings and os.path.isfile(
+            os.path.join(DIST_DIR, filename + extension)
+        ):
+            response = send_from_directory(
+                DIST_DIR, filename + extension, mimetype=mimetype
+            )
+            response.content_encoding = encoding
+            break
+    else:
+        response = send_from_directory(DIST_DIR, filename, mimetype=mimetype)
+
+    response.headers["Cache-Control"] = IMMUTABLE_CACHE
+    response.vary.add("Accept-Encoding")
+
+    return response
+
+
+def init_assets(app):
+    """Load asset manifest and add the helpers to templates
+
+    In debug mode the manifest is skipped, so edits to static files show up
+    instead of an old build."""
+
+    app.config["ASSET_MANIFEST"] = {} if app.debug else load_manifest()
+    app.add_template_global(asset_url)
+    app.add_template_global(asset_srcset)
+    app.register_blueprint(assets_bp)
@@ -0,0 +1,189 @@
+"""Build fingerprinted static assets into static/dist
+
+    python build_assets.py
+
+- minifies app.js and style.css (rjsmin/rcssmin if installed)
+- re-encodes pictures to smaller PNGs plus resized WebP versions (Pillow)
+- names every file after a hash of its content
+- precompresses text files with gzip and brotli (if installed)
+- writes static/dist/manifest.json, used by asset_url() and asset_srcset()
+"""
+
+import glob
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+
+from assets import DIST_DIR, MANIFEST_FILE, STATIC_DIR
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+SCRIPTS_AND_STYLES = ["app.js", "style.css"]
+PICTURES = "pictures/*.png"
+
+# Widths of the resized pictures, for srcset
+PICTURE_WIDTHS = [320, 640, 960]
+WEBP_QUALITY = 80
+
+
+def minify_css(css):
+    """Remove comments and extra whitespace from CSS"""
+
+    if rcssmin:
+        return rcssmin.cssmin(css)
+
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{}:;,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def minify_js(js):
+    """Remove comments and indentation from JS"""
+
+    if rjsmin:
+        return rjsmin.jsmin(js)
+
+    # Only drop whole comment lines and indentation, which is safe for the
+    # template literals in app.js
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+def hashed_name(filename, content):
+    """Return filename with a hash of content, e.g. app.1a2b3c4d.js"""
+
+    root, extension = os.path.splitext(filename)
+    digest = hashlib.sha256(content).hexdigest()[:10]
+    return f"{root}.{digest}{extension}"
+
+
+def write(filename, content, compress=False):
+    """Write content to static/dist, with .gz and .br versions if compress"""
+
+    path = os.path.join(DIST_DIR, filename)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with open(path, "wb") as f:
+        f.write(content)
+
+    if compress:
+        with open(path + ".gz", "wb") as f:
+            f.write(gzip.compress(content, compresslevel=9, mtime=0))
+        if brotli:
+            with open(path + ".br", "wb") as f:
+                f.write(brotli.compress(content, quality=11))
+
+
+def build_text_asset(filename):
+    """Minify, hash and compress app.js or style.css"""
+
+    with open(os.path.join(STATIC_DIR, filename)) as f:
+        text = f.read()
+
+    minify = minify_js if filename.endswith(".js") else minify_css
+    content = minify(text).encode("UTF-8")
+
+    built = hashed_name(filename, content)
+    write(built, content, compress=True)
+
+    return {"file": built}
+
+
+def encode_image(image, image_format, **options):
+    """Return image encoded as bytes"""
+
+    buffer = io.BytesIO()
+    image.save(buffer, image_format, **options)
+    return buffer.getvalue()
+
+
+def build_picture(filename):
+    """Re-encode picture and make resized WebP versions of it"""
+
+    path = os.path.join(STATIC_DIR, filename)
+
+    # Without Pillow, just fingerprint the original
+    if not Image:
+        with open(path, "rb") as f:
+            content = f.read()
+        built = hashed_name(filename, content)
+        write(built, content)
+        return {"file": built}
+
+    image = Image.open(path)
+
+    # Keep the smaller of the original and the optimized PNG
+    with open(path, "rb") as f:
+        content = f.read()
+    optimized = encode_image(image, "PNG", optimize=True)
+    if len(optimized) < len(content):
+        content = optimized
+
+    built = hashed_name(filename, content)
+    write(built, content)
+
+    root = os.path.splitext(filename)[0]
+    source = image.convert("RGBA") if image.mode in ("P", "LA") else image
+    # Never upscale, and never go past the largest width
+    widths = sorted({min(width, image.width) for width in PICTURE_WIDTHS})
+    srcset = []
+
+    for width in widths:
+        height = round(image.height * width / image.width)
+        resized = source.resize((width, height), Image.LANCZOS)
+        webp = encode_image(resized, "WEBP", quality=WEBP_QUALITY, method=6)
+
+        resized_name = hashed_name(f"{root}-{width}.webp", webp)
+        write(resized_name, webp)
+        srcset.append((resized_name, width))
+
+    return {"file": built, "srcset": srcset}
+
+
+def build():
+    """Rebuild static/dist and its manifest"""
+
+    shutil.rmtree(DIST_DIR, ignore_errors=True)
+    os.makedirs(DIST_DIR)
+
+    manifest = {}
+
+    for filename in SCRIPTS_AND_STYLES:
+        manifest[filename] = build_text_asset(filename)
+
+    for path in sorted(glob.glob(os.path.join(STATIC_DIR, PICTURES))):
+        filename = os.path.relpath(path, STATIC_DIR).replace(os.sep, "/")
+        manifest[filename] = build_picture(filename)
+
+    with open(MANIFEST_FILE, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    return manifest
+
+
+if __name__ == "__main__":
+    for filename, entry in build().items():
+        print(f"{filename} -> {entry['file']}")
@@ -0,0 +1,291 @@
+import datetime
+import gzip
+import hashlib
+import json
+import time
+
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    flash,
+    jsonify,
+    redirect,
+    render_template,
+    request,
+)
+from markupsafe import Markup
+from sqlalchemy.exc import IntegrityError, OperationalError, ProgrammingError
+
+import sportsdata
+from models import TournamentLeaderboard, db
+
+# Calculate current Year for API
+CURRENT_YEAR = datetime.datetime.now().year
+
+# News is fetched from the API at most once per interval (seconds)
+NEWS_REFRESH_INTERVAL = 300
+NEWS_SUMMARY_LENGTH = 300
+NEWS_PER_PAGE = 5
+NEWS_MAX_PER_PAGE = 20
+
+golf_news_bp = Blueprint("golf_news", __name__)
+
+
+@golf_news_bp.record_once
+def init_golf_news(state):
+    """Give each app its own API client and news cache"""
+
+    state.app.extensions["sportsdata"] = sportsdata.Client()
+    # Trimmed articles and rendered pages, shared by every visitor
+    state.app.extensions["news_cache"] = {"fetched_at": 0, "articles": [], "pages": {}}
+
+
+def api():
+    """Return API client of the current app"""
+
+    return current_app.extensions["sportsdata"]
+
+
+# GOLF BLOG API's
+@golf_news_bp.route("/golf_news")
+def show_golf_news():
+    """Display Golf News Home Page"""
+    return render_template("/golf_news/home.html")
+
+
+def summarize(text, length=NEWS_SUMMARY_LENGTH):
+    """Cut text down to length, on a word boundary"""
+
+    if len(text) <= length:
+        return text
+
+    return text[:length].rsplit(" ", 1)[0] + "..."
+
+
+def trim_news_article(article):
+    """Keep only the fields the news page shows, stripped of any HTML"""
+
+    content = Markup(article.get("Content") or "").striptags()
+    source_url = article.get("OriginalSourceUrl") or ""
+
+    return {
+        "NewsID": article.get("NewsID"),
+        "Title": Markup(article.get("Title") or "").striptags(),
+        "Updated": article.get("Updated"),
+        "OriginalSource": Markup(article.get("OriginalSource") or "").striptags(),
+        # Only allow http(s) links
+        "OriginalSourceUrl": source_url
+        if source_url.startswith(("http://", "https://"))
+        else "",
+        "Summary": summarize(content),
+    }
+
+
+def get_news_articles():
+    """Return trimmed news articles, refreshing from API once per interval"""
+
+    news_cache = current_app.extensions["news_cache"]
+
+    if time.time() - news_cache["fetched_at"] < NEWS_REFRESH_INTERVAL:
+        return news_cache["articles"]
+
+    try:
+        articles = [
+            trim_news_article(article) for article in api().get_json("News")
+        ]
+    # Keep serving the old articles if the API is down or out of quota
+    except sportsdata.UpstreamUnavailable:
+        return news_cache["articles"]
+
+    news_cache["articles"] = articles
+    news_cache["pages"] = {}
+    news_cache["fetched_at"] = time.time()
+
+    return articles
+
+
+def get_news_page(page, per_page):
+    """Return (body, gzipped body, etag) of a page of news
+
+    Pages are rendered and compressed once per refresh interval."""
+
+    news_cache = current_app.extensions["news_cache"]
+
+    articles = get_news_articles()
+
+    # Past the last page, show the last page
+    pages = max(-(-len(articles) // per_page), 1)
+    page = min(page, pages)
+
+    if (page, per_page) in news_cache["pages"]:
+        return news_cache["pages"][(page, per_page)]
+
+    start = (page - 1) * per_page
+    page_articles = articles[start : start + per_page]
+
+    body = json.dumps(
+        {
+            "page": page,
+            "per_page": per_page,
+            "total": len(articles),
+            "pages": pages,
+            "html": render_template(
+                "golf_news/news_articles.html", articles=page_articles
+            ),
+        },
+        separators=(",", ":"),
+    ).encode("UTF-8")
+
+    news_page = (body, gzip.compress(body, mtime=0), hashlib.md5(body).hexdigest())
+    news_cache["pages"][(page, per_page)] = news_page
+
+    return news_page
+
+
+@golf_news_bp.route("/api/news")
+def news_api():
+    """Return a page of golf news as JSON
+
+    Supports ?page= and ?per_page=, gzip and ETags."""
+
+    page = max(request.args.get("page", 1, type=int), 1)
+    per_page = request.args.get("per_page", NEWS_PER_PAGE, type=int)
+    per_page = min(max(per_page, 1), NEWS_MAX_PER_PAGE)
+
+    body, gzipped_body, etag = get_news_page(page, per_page)
+
+    # Gzipped body is a different representation, so it gets its own ETag
+    use_gzip = "gzip" in request.accept_encodings
+    if use_gzip:
+        body, etag = gzipped_body, f"{etag}-gzip"
+
+    fetched_at = current_app.extensions["news_cache"]["fetched_at"]
+    max_age = max(int(NEWS_REFRESH_INTERVAL - (time.time() - fetched_at)), 0)
+
+    # Browser already has this page
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype="application/json")
+        if use_gzip:
+            response.content_encoding = "gzip"
+
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    response.vary.add("Accept-Encoding")
+
+    return response
+
+
+@golf_news_bp.route("/golf_news/schedule")
+def show_PGA_schedule():
+    """Display PGA schedule base on season"""
+
+    # Fetch PGA schedule data from API
+    tournaments = api().get_json("Tournaments", CURRENT_YEAR)
+    return render_template("golf_news/schedule.html", tournaments=tournaments)
+
+
+@golf_news_bp.route("/golf_news/leaderboard/<int:tournament_id>")
+def show_tournament_leaderboard(tournament_id):
+    """Display Leaderboard of tournament"""
+
+    leaderboard_data = get_tournament_leaderboard(tournament_id)
+    return render_template(
+        "golf_news/leaderboard.html", leaderboard_data=leaderboard_data
+    )
+
+
+def tournament_is_over(tournament):
+    """Check the tournament status in the Tournament object of a leaderboard"""
+
+    if not tournament:
+        return False
+
+    return bool(tournament.get("IsOver")) and not tournament.get("IsInProgress")
+
+
+def get_tournament_leaderboard(tournament_id):
+    """Get leaderboard of tournament
+
+    Finished tournaments are served from the database, in-progress ones
+    are fetched from the API. A leaderboard is saved the first time it is
+    fetched after the tournament is over.
+
+    If the tournament_leaderboards table hasn't been created yet (flask
+    create-tables), every leaderboard is fetched from the API."""
+
+    # Finished leaderboards never change, serve saved copy
+    try:
+        saved = TournamentLeaderboard.query.get(tournament_id)
+    # Table doesn't exist yet
+    except (OperationalError, ProgrammingError):
+        db.session.rollback()
+        return api().get_json("Leaderboard", tournament_id)
+
+    if saved:
+        return saved.leaderboard
+
+    # Fetch leaderboard data for the specified tournament from API
+    leaderboard_data = api().get_json("Leaderboard", tournament_id)
+
+    # Save leaderboard once tournament is over
+    if tournament_is_over(leaderboard_data.get("Tournament")):
+        try:
+            TournamentLeaderboard.save(leaderboard_data)
+            db.session.commit()
+            # Served from the database from now on
+            api().forget("Leaderboard", tournament_id)
+        # Another request already saved it
+        except IntegrityError:
+            db.session.rollback()
+
+    return leaderboard_data
+
+
+@golf_news_bp.route("/api/leaderboard/<int:tournament_id>")
+def leaderboard_api(tournament_id):
+    """Return leaderboard of tournament as JSON, for app.js"""
+
+    return jsonify(get_tournament_leaderboard(tournament_id))
+
+
+@golf_news_bp.route("/api/metrics")
+def upstream_metrics():
+    """Return API call counts and remaining quota"""
+
+    return jsonify(api().metrics())
+
+
+@golf_news_bp.errorhandler(sportsdata.UpstreamUnavailable)
+def upstream_unavailable(error):
+    """API is down or out of quota and nothing is cached"""
+
+    if request.path.startswith("/api/"):
+        return jsonify(error=str(error)), 503
+
+    flash("PGA Tour data is unavailable right now, try again later", "danger")
+    return redirect("/golf_news")
+
+
+@golf_news_bp.route("/golf_news/current_leaderboard")
+def show_current_leaderboard():
+    """Display Current Tournament Leaderboard"""
+    return render_template("golf_news/current_leaderboard.html")
+
+
+@golf_news_bp.route("/golf_news/world_rankings")
+def show_world_rankings():
+    """Display World Rankings"""
+    rankings = api().get_json("PlayerSeasonStats", CURRENT_YEAR)
+    return render_template("golf_news/world_rankings.html", rankings=rankings)
+
+
+@golf_news_bp.route("/golf_news/player/<int:player_id>")
+def show_player_details(player_id):
+    """Display Player Details"""
+    player = api().get_json("Player", player_id)
+    news = api().get_json("NewsByPlayerID", player_id)
+    return render_template("golf_news/player.html", player=player, news=news)
@@ -0,0 +1,175 @@
+from flask import Blueprint, flash, g, redirect, render_template
+
+from forms import AddGolfRoundForm, AddGolfRoundForm18
+from models import GolfRound, HoleScore, db
+
+golf_round_bp = Blueprint("golf_round", __name__, url_prefix="/golf_round")
+
+
+# Standalone Functions for Golf Rounds
+def create_golf_round(user_id, date_played, course_name):
+    """Create a GolfRound Instace and save it to database"""
+    golf_round = GolfRound(
+        user_id=user_id,
+        date_played=date_played,
+        course_name=course_name,
+        par=0,
+        total_score=0,
+    )
+    db.session.add(golf_round)
+    db.session.commit()
+
+    return golf_round
+
+
+def save_hole_scores(golf_round, hole_scores_form, hole_count):
+    """Save hole scores to the database for the given golf round"""
+    for idx in range(hole_count):
+        hole_score = HoleScore(
+            hole_number=idx + 1,
+            par=int(hole_scores_form[idx].par.data),
+            fairway_hit=hole_scores_form[idx].fairway_hit.data,
+            green_in_regulation=hole_scores_form[idx].green_in_regulation.data,
+            putts=hole_scores_form[idx].putts.data,
+            score=hole_scores_form[idx].score.data,
+        )
+        # Add each golf hole to GOLF ROUND
+        golf_round.hole_scores.append(hole_score)
+
+        # Track Par of Course
+        golf_round.par += hole_score.par
+        # Update the total score of the golf round
+        golf_round.total_score += hole_score.score
+
+        # Add to database
+    db.session.commit()
+
+
+#####################################################
+# Golf Rounds Add/Show Previous Rounds/Edit/Delete
+@golf_round_bp.route("/add9", methods=["GET", "POST"])
+def add_golf_round9():
+    """Handle User Adding New Golf Round"""
+    
+    #if not logged in 
+    if not g.user:
+        flash("Access unauthorized.", "danger")
+        return redirect("/")
+
+    form = AddGolfRoundForm()
+
+    if form.validate_on_submit():
+        hole_count = int(form.hole_count.data)
+        golf_round = create_golf_round(
+            g.user.id, form.date_played.data, form.course_name.data
+        )
+        save_hole_scores(golf_round, form.hole_scores, hole_count)
+
+        return redirect("/")
+
+    return render_template("golf_round/add9.html", form=form)
+
+
+@golf_round_bp.route("/add18", methods=["GET", "POST"])
+def add_golf_round18():
+    """Handle User Adding New Golf Round (18 HOLES)"""
+
+    if not g.user:
+        flash("Access unauthorized.", "danger")
+        return redirect("/")
+
+    form = AddGolfRoundForm18()
+
+    if form.validate_on_submit():
+        hole_count = int(form.hole_count.data)
+        golf_round = create_golf_round(
+            g.user.id, form.date_played.data, form.course_name.data
+        )
+        save_hole_scores(golf_round, form.hole_scores, hole_count)
+
+        return redirect("/")
+
+    return render_template("golf_round/add18.html", form=form)
+
+
+@golf_round_bp.route("/history")
+def previous_rounds():
+    """Show all previous rounds recorded"""
+
+    if not g.user:
+        flash("Access unauthorized.", "danger")
+        return redirect("/")
+
+    golf_rounds = GolfRound.query.filter_by(user_id=g.user.id).all()
+
+    # Calculates Over/Under Par
+    for golf_round in golf_rounds:
+        golf_round.difference = golf_round.total_score - golf_round.par
+
+    return render_template("golf_round/history.html", golf_rounds=golf_rounds)
+
+
+@golf_round_bp.route("/<int:golf_round_id>")
+def golf_round_details(golf_round_id):
+    """Show detail on specific round"""
+
+    if not g.user:
+        flash("Access unauthorized.", "danger")
+        return redirect("/")
+    golf_round = GolfRound.query.get_or_404(golf_round_id)
+
+    return render_template("golf_round/details.html", golf_round=golf_round)
+
+
+@golf_round_bp.route("/<int:golf_round_id>/edit", methods=["GET", "POST"])
+def golf_round_edit(golf_round_id):
+    """Edit scores"""
+    
+    if not g.user:
+        flash("Access unauthorized.", "danger")
+        return redirect("/")
+    golf_round = GolfRound.query.get_or_404(golf_round_id)
+
+    # Prepopulate Form
+    form = AddGolfRoundForm(obj=golf_round)
+
+    if form.validate_on_submit():
+        # EDIT Golf Round Information
+        golf_round.date_played = form.date_played.data
+        golf_round.course_name = form.course_name.data
+        golf_round.hole_count = int(form.hole_count.data)
+
+        # EDIT Individual Holes
+        for idx in range(golf_round.hole_count):
+            hole = golf_round.hole_scores[idx]
+            hole.hole_number = idx + 1
+            hole.par = int(form.hole_scores[idx].par.data)
+            hole.fairway_hit = form.hole_scores[idx].fairway_hit.data
+            hole.green_in_regulation = form.hole_scores[idx].green_in_regulation.data
+            hole.putts = form.hole_scores[idx].putts.data
+            hole.score = form.hole_scores[idx].score.data
+        # Add to DB
+        db.session.commit()
+
+        return redirect(f"/golf_round/{golf_round_id}")
+
+    return render_template("golf_round/edit.html", form=form)
+
+
+@golf_round_bp.route("/<int:golf_round_id>/delete", methods=["POST"])
+def delete_golf_round(golf_round_id):
+    """Delete Golf Round"""
+    if not g.user:
+        flash("Access unauthorized.", "danger")
+        return redirect("/")
+    # Get golf round
+    golf_round = GolfRound.query.get_or_404(golf_round_id)
+
+    # Delete associated holes with golf round first
+    HoleScore.query.filter_by(golf_round_id=golf_round_id).delete()
+
+    # Delete golf round
+    db.session.delete(golf_round)
+    db.session.commit()
+
+    return redirect("/golf_round/history")
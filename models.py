@@ -1,3 +1,5 @@
+import json
+import zlib
 from datetime import datetime
 
 from flask_bcrypt import Bcrypt
@@ -102,6 +104,49 @@ class Handicap(db.Model):
         return f"<User #{self.user_id} Handicap: {self.value}>"
 
 
+class TournamentLeaderboard(db.Model):
+    """Final leaderboard of a finished tournament.
+
+    Leaderboards never change once a tournament is over, so the API payload
+    is stored once (zlib-compressed JSON) and served from here afterwards.
+    """
+
+    __tablename__ = "tournament_leaderboards"
+
+    tournament_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    name = db.Column(db.String(200), nullable=False)
+    season = db.Column(db.Integer, index=True)
+    data = db.Column(db.LargeBinary, nullable=False)
+    saved_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    @property
+    def leaderboard(self):
+        """Return the stored leaderboard payload as a dict"""
+
+        return json.loads(zlib.decompress(self.data).decode("UTF-8"))
+
+    @classmethod
+    def save(cls, leaderboard_data):
+        """Store the leaderboard payload of a finished tournament"""
+
+        tournament = leaderboard_data["Tournament"]
+        payload = json.dumps(leaderboard_data, separators=(",", ":"))
+
+        leaderboard = TournamentLeaderboard(
+            tournament_id=tournament["TournamentID"],
+            name=tournament["Name"],
+            season=tournament.get("Season"),
+            data=zlib.compress(payload.encode("UTF-8"), 9),
+        )
+
+        db.session.add(leaderboard)
+
+        return leaderboard
+
+    def __repr__(self):
+        return f"<Tournament #{self.tournament_id}: {self.name} Season: {self.season}>"
+
+
 def connect_db(app):
     db.app = app
     db.init_app(app)
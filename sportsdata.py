@@ -0,0 +1,322 @@
+"""Client for the sportsdata.io golf API
+
+Every call to the API goes through Client.get_json(), which:
+
+- serves cached data while it is fresh (each endpoint has its own TTL)
+- refreshes stale data only if the quota allows it
+- falls back to stale cached data when the quota is spent or the API fails
+
+The quota is a token bucket shared by all endpoints, plus a bucket per
+endpoint. Low priority endpoints (player bios) can't use the last part of
+the shared bucket, which is kept for live leaderboards.
+
+Each app gets its own Client, holding its buckets, counts and cache, so
+apps built in one process don't share them. The API key is shared
+by every worker, so each worker gets 1/WEB_CONCURRENCY of the budget (the
+same variable gunicorn reads for its worker count). Keep WEB_CONCURRENCY
+equal to the number of workers, or the key can go over its quota.
+/api/metrics reports the worker that answered it.
+
+The cache keeps at most MAX_CACHE_ENTRIES responses, dropping the least
+recently used.
+
+SPORTSDATA_MODE switches where responses come from:
+
+- live: call the API (default)
+- record: call the API and save each response to SPORTSDATA_FIXTURES
+- replay: serve saved responses only, with SPORTSDATA_LATENCY seconds of
+  delay and SPORTSDATA_ERROR_RATE (0 to 1) of requests failing
+"""
+
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+BASE_URL = os.environ.get(
+    "SPORTSDATA_BASE_URL", "https://api.sportsdata.io/golf/v2/json"
+)
+API_KEY = os.environ.get("SPORTSDATA_API_KEY", "176964ab9ddb48dea44c9fb38e4adbc8")
+REQUEST_TIMEOUT = 10
+
+# Record/replay of API responses, for offline load testing
+MODE = os.environ.get("SPORTSDATA_MODE", "live")
+FIXTURES_DIR = os.environ.get(
+    "SPORTSDATA_FIXTURES",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "sportsdata"),
+)
+LATENCY = float(os.environ.get("SPORTSDATA_LATENCY", 0))
+ERROR_RATE = float(os.environ.get("SPORTSDATA_ERROR_RATE", 0))
+
+# Calls per hour allowed across all endpoints, for the whole API key
+CALLS_PER_HOUR = int(os.environ.get("SPORTSDATA_CALLS_PER_HOUR", 1000))
+
+# Worker processes sharing the API key, each gets an equal part of the budget
+WORKERS = max(int(os.environ.get("WEB_CONCURRENCY", 1)), 1)
+
+MAX_CACHE_ENTRIES = int(os.environ.get("SPORTSDATA_CACHE_ENTRIES", 500))
+
+# priority: 0 is most important
+# ttl: seconds before cached data is refreshed
+# calls_per_hour: budget of this endpoint, for the whole API key
+Endpoint = namedtuple("Endpoint", ["priority", "ttl", "calls_per_hour"])
+
+ENDPOINTS = {
+    "Leaderboard": Endpoint(priority=0, ttl=60, calls_per_hour=600),
+    "News": Endpoint(priority=1, ttl=300, calls_per_hour=60),
+    "Tournaments": Endpoint(priority=2, ttl=3600, calls_per_hour=30),
+    "PlayerSeasonStats": Endpoint(priority=2, ttl=3600, calls_per_hour=30),
+    "NewsByPlayerID": Endpoint(priority=3, ttl=1800, calls_per_hour=200),
+    "Player": Endpoint(priority=3, ttl=86400, calls_per_hour=200),
+}
+
+# Part of the shared bucket each priority must leave for higher priorities
+PRIORITY_RESERVE = {0: 0, 1: 0.1, 2: 0.25, 3: 0.4}
+
+
+class UpstreamUnavailable(Exception):
+    """API can't be reached and there is no cached data to serve"""
+
+
+class QuotaExceeded(UpstreamUnavailable):
+    """Quota is spent and there is no cached data to serve"""
+
+
+class TokenBucket:
+    """Token bucket holding up to capacity tokens, refilled over an hour"""
+
+    def __init__(self, calls_per_hour):
+        self.capacity = calls_per_hour
+        self.tokens = float(calls_per_hour)
+        self.refill_rate = calls_per_hour / 3600
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate
+        )
+        self.updated_at = now
+
+    def remaining(self):
+        """Return whole tokens left"""
+
+        with self.lock:
+            self._refill()
+            return int(self.tokens)
+
+    def consume(self, reserve=0):
+        """Take a token, leaving at least reserve tokens in the bucket
+
+        Returns False if there aren't enough tokens."""
+
+        with self.lock:
+            self._refill()
+            if self.tokens - 1 < reserve:
+                return False
+            self.tokens -= 1
+            return True
+
+    def refund(self):
+        """Give back a token that wasn't used"""
+
+        with self.lock:
+            self.tokens = min(self.capacity, self.tokens + 1)
+
+
+def cache_path(name, *args):
+    """Return cache key of endpoint name, e.g. Player/123"""
+
+    return "/".join([name, *[str(arg) for arg in args]])
+
+
+def fixture_file(path):
+    """Return file a response of path is recorded to"""
+
+    return os.path.join(FIXTURES_DIR, path.replace("/", "_") + ".json")
+
+
+def record(path, data):
+    """Save API response of path to a fixture file
+
+    Written to a temp file first, so a fixture is never left half written."""
+
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=FIXTURES_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(temp_path, fixture_file(path))
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def replay(path):
+    """Return recorded response of path, with injected latency and errors
+
+    Raises UpstreamUnavailable for an injected error or a missing or
+    corrupt fixture."""
+
+    if LATENCY:
+        time.sleep(LATENCY)
+
+    if random.random() < ERROR_RATE:
+        raise UpstreamUnavailable(f"Injected error for {path}")
+
+    try:
+        with open(fixture_file(path)) as f:
+            return json.load(f)
+    except FileNotFoundError as e:
+        raise UpstreamUnavailable(f"No fixture recorded for {path}") from e
+    except ValueError as e:
+        raise UpstreamUnavailable(f"Corrupt fixture for {path}") from e
+
+
+def fetch(path):
+    """GET path from the API and return the decoded JSON
+
+    Raises UpstreamUnavailable if the request fails."""
+
+    if MODE == "replay":
+        return replay(path)
+
+    # Imported here so workers that never call the API don't load it
+    import requests
+
+    try:
+        response = requests.get(
+            f"{BASE_URL}/{path}", params={"key": API_KEY}, timeout=REQUEST_TIMEOUT
+        )
+        response.raise_for_status()
+        data = response.json()
+    except (requests.RequestException, ValueError) as e:
+        raise UpstreamUnavailable(f"Could not fetch {path}") from e
+
+    if MODE == "record":
+        record(path, data)
+
+    return data
+
+
+class Client:
+    """Quota buckets, call counts and response cache of one app"""
+
+    def __init__(self):
+        self.global_bucket = TokenBucket(CALLS_PER_HOUR / WORKERS)
+        self.endpoint_buckets = {
+            name: TokenBucket(endpoint.calls_per_hour / WORKERS)
+            for name, endpoint in ENDPOINTS.items()
+        }
+
+        # path -> (fetched_at, data), least recently used first
+        self.cache = OrderedDict()
+        self.cache_lock = threading.Lock()
+
+        self.counts = {
+            name: dict.fromkeys(
+                ["calls", "cache_hits", "stale", "throttled", "errors"], 0
+            )
+            for name in ENDPOINTS
+        }
+
+    def acquire(self, name):
+        """Take a token for endpoint if its budget and its priority allow it"""
+
+        endpoint = ENDPOINTS[name]
+        reserve = self.global_bucket.capacity * PRIORITY_RESERVE[endpoint.priority]
+
+        if not self.endpoint_buckets[name].consume():
+            return False
+
+        if not self.global_bucket.consume(reserve):
+            # Nothing was called, give back the endpoint token
+            self.endpoint_buckets[name].refund()
+            return False
+
+        return True
+
+    def cache_get(self, path):
+        """Return (fetched_at, data) of path, or None if not cached"""
+
+        with self.cache_lock:
+            cached = self.cache.get(path)
+            if cached:
+                self.cache.move_to_end(path)
+            return cached
+
+    def cache_put(self, path, data):
+        """Cache data of path, dropping least recently used entries if full"""
+
+        with self.cache_lock:
+            self.cache[path] = (time.time(), data)
+            self.cache.move_to_end(path)
+            while len(self.cache) > MAX_CACHE_ENTRIES:
+                self.cache.popitem(last=False)
+
+    def forget(self, name, *args):
+        """Drop cached data, e.g. once it is stored somewhere else"""
+
+        with self.cache_lock:
+            self.cache.pop(cache_path(name, *args), None)
+
+    def get_json(self, name, *args):
+        """Return API data for endpoint name, e.g. get_json("Player", 123)
+
+        Raises QuotaExceeded or UpstreamUnavailable if the data can't be
+        fetched and nothing is cached."""
+
+        path = cache_path(name, *args)
+        cached = self.cache_get(path)
+        counts = self.counts[name]
+
+        # Fresh enough, no API call
+        if cached and time.time() - cached[0] < ENDPOINTS[name].ttl:
+            counts["cache_hits"] += 1
+            return cached[1]
+
+        if not self.acquire(name):
+            counts["throttled"] += 1
+            if cached:
+                counts["stale"] += 1
+                return cached[1]
+            raise QuotaExceeded(f"No quota left for {name}")
+
+        counts["calls"] += 1
+        try:
+            data = fetch(path)
+        except UpstreamUnavailable:
+            counts["errors"] += 1
+            if cached:
+                counts["stale"] += 1
+                return cached[1]
+            raise
+
+        self.cache_put(path, data)
+        return data
+
+    def metrics(self):
+        """Return call counts and remaining budget of every endpoint
+
+        Only covers this worker, capacities are this worker's share."""
+
+        return {
+            "pid": os.getpid(),
+            "workers": WORKERS,
+            "remaining": self.global_bucket.remaining(),
+            "capacity": self.global_bucket.capacity,
+            "endpoints": {
+                name: {
+                    **self.counts[name],
+                    "priority": endpoint.priority,
+                    "remaining": self.endpoint_buckets[name].remaining(),
+                    "capacity": self.endpoint_buckets[name].capacity,
+                }
+                for name, endpoint in ENDPOINTS.items()
+            },
+            "cached": len(self.cache),
+        }
@@ -1,6 +1,5 @@
-//API URLS
-const BASE_URL = "https:api.sportsdata.io/golf/v2/json";
-const URL_KEY = "key=176964ab9ddb48dea44c9fb38e4adbc8";
+//Leaderboards come from our server, which caches the API and tracks quota
+const LEADERBOARD_URL = "/api/leaderboard";
 
 //Dates for API
 const currentDate = new Date();
@@ -10,26 +9,22 @@ const CURRENTYEAR = currentDate.getFullYear();
 const blogContainer = document.getElementById("blog-container");
 
 /////////////////////////////////////////////////////////////////////////////////////////
-//Generate HTML/Structure for the News API
-function generateNewsHTML(data) {
-  return `
-    <h4 class="text-center display-6">${data.Title}</h4>
-    <p class="text-center">    <a href="${data.OriginalSourceUrl}">Source: ${data.OriginalSource}</a></p>
+//Next page of news to load
+let newsPage = 1;
 
-    <p>${data.Content}</p>
-    `;
-}
-
-//GET request to API, specifically News
-//Use generateNewsHTML() to create HTML for News and add to page
+//GET request to our server, which caches the News API
+//Articles come back already rendered, so add the whole page at once
 async function getNews() {
-  const response = await axios.get(`${BASE_URL}/News?${URL_KEY}`);
-  data = response.data;
-  for (let item of data) {
-    let news = $(generateNewsHTML(item));
-    $("#todays-news-container").append(news);
-  }
+  const response = await axios.get("/api/news", { params: { page: newsPage } });
+  const data = response.data;
+  $("#news-articles").append(data.html);
+
+  //Hide button when there are no more pages
+  newsPage = data.page + 1;
+  $("#more-news-button").toggle(newsPage <= data.pages);
 }
+
+$("#more-news-button").on("click", getNews);
 /////////////////////////////////////////////////////////////////////////////////////////
 
 //Generate HTML/Structure for the Current Tournament Leaderboard API
@@ -67,9 +62,7 @@ async function getLeaderboard() {
 
   const nextTournamentId = getNextTournamentId(currentTournamentId);
 
-  const response = await axios.get(
-    `${BASE_URL}/Leaderboard/${nextTournamentId}?${URL_KEY}`
-  );
+  const response = await axios.get(`${LEADERBOARD_URL}/${nextTournamentId}`);
   const players = response.data.Players;
   const tournament = response.data.Tournament.Name;
 
@@ -109,9 +102,7 @@ async function getNextTournament() {
 
   const nextTournamentId = getNextTournamentId(currentTournamentId);
 
-  const response = await axios.get(
-    `${BASE_URL}/Leaderboard/${nextTournamentId}?${URL_KEY}`
-  );
+  const response = await axios.get(`${LEADERBOARD_URL}/${nextTournamentId}`);
 
   const tournament = response.data.Tournament;
 
@@ -122,8 +113,15 @@ async function getNextTournament() {
   $("#next-tournament-list").append(information);
 }
 /////////////////////////////////////////////////////////////////////////////////////////
-getNews();
-getLeaderboard();
-getNextTournament();
+//Only fetch data on the pages that show it
+if ($("#todays-news-container").length) {
+  getNews();
+}
+if ($("#leaderboard-body, #current-leaderboard-body").length) {
+  getLeaderboard();
+}
+if ($("#next-tournament-container").length) {
+  getNextTournament();
+}
 
 /////////////////////////////////////////////////////////////////////////////////////////
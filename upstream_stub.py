@@ -0,0 +1,31 @@
+"""Local stand-in for the sportsdata.io golf API
+
+Serves responses recorded with SPORTSDATA_MODE=record, with the latency and
+error rate set by SPORTSDATA_LATENCY and SPORTSDATA_ERROR_RATE. Point the
+app at it to load test without using API quota:
+
+    python upstream_stub.py
+    SPORTSDATA_BASE_URL=http://localhost:5001/golf/v2/json flask run
+"""
+
+import os
+
+from flask import Flask, jsonify
+
+import sportsdata
+
+stub = Flask(__name__)
+
+
+@stub.route("/golf/v2/json/<path:path>")
+def serve_fixture(path):
+    """Return recorded response of path, like the API would"""
+
+    try:
+        return jsonify(sportsdata.replay(path))
+    except sportsdata.UpstreamUnavailable as e:
+        return jsonify(error=str(e)), 503
+
+
+if __name__ == "__main__":
+    stub.run(port=int(os.environ.get("STUB_PORT", 5001)), threaded=True)